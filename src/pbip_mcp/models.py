@@ -2,11 +2,30 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
 
+def normalize_element_name(name: str) -> str:
+    """Strip whitespace and one pair of surrounding quotes from an element name."""
+    if not name:
+        return name
+    name = name.strip()
+    if name and name[0] == name[-1] and name[0] in "'\"":
+        return name[1:-1]
+    return name
+
+
+def _index_by_name(elements: list) -> Dict[str, Any]:
+    """Map normalized names to elements, keeping the first of any duplicates."""
+    index: Dict[str, Any] = {}
+    for element in elements:
+        index.setdefault(normalize_element_name(element.name), element)
+    return index
+
+
 class DataType(str, Enum):
     """Column data types supported in TMDL."""
 
@@ -166,6 +185,16 @@ class Table(BaseModel):
     description: Optional[str] = None
     annotations: List[Annotation] = Field(default_factory=list)
 
+    @cached_property
+    def columns_by_name(self) -> Dict[str, Column]:
+        """Columns keyed by normalized name."""
+        return _index_by_name(self.columns)
+
+    @cached_property
+    def measures_by_name(self) -> Dict[str, Measure]:
+        """Measures keyed by normalized name."""
+        return _index_by_name(self.measures)
+
 
 class Relationship(BaseModel):
     """TMDL relationship definition."""
@@ -211,6 +240,11 @@ class SemanticModel(BaseModel):
     culture_infos: List[CultureInfo] = Field(default_factory=list)
     annotations: List[Annotation] = Field(default_factory=list)
 
+    @cached_property
+    def tables_by_name(self) -> Dict[str, Table]:
+        """Tables keyed by normalized name."""
+        return _index_by_name(self.tables)
+
 
 class ProjectReference(BaseModel):
     """PBIP project reference."""
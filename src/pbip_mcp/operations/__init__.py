@@ -1,6 +1,6 @@
 """PBIP operations module."""
 
-from .base import BaseOperation, OperationType
+from .base import BaseOperation, OperationHandler, OperationType
 from .measures import MeasureOperations
 from .columns import ColumnOperations
 from .tables import TableOperations
@@ -8,6 +8,7 @@ from .relationships import RelationshipOperations
 
 __all__ = [
     "BaseOperation",
+    "OperationHandler",
     "OperationType",
     "MeasureOperations",
     "ColumnOperations",
@@ -1,15 +1,18 @@
 """Base operation class for PBIP operations."""
 
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Tuple
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from mcp.types import TextContent
-import json
 import re
 
-from ..parsers import ProjectParser
-from ..writers import TMDLWriter
+from ..models import normalize_element_name
+from ..parsers import ProjectParser, get_project_parser, invalidate_tmdl_file
+from ..serialization import dumps
+from ..writers import TMDLWriter, get_tmdl_writer
 
 
 class OperationType:
@@ -22,12 +25,76 @@ class OperationType:
     GET_MODEL_DETAILS = "get_model_details"
 
 
+OperationHandler = Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]
+
+
 class BaseOperation(ABC):
     """Base class for all PBIP operations."""
     
+    # Operation types that only read the project; their responses are reused
+    # for as long as the project parser hands back the same parsed project
+    READ_OPERATIONS: FrozenSet[str] = frozenset()
+    RESPONSE_CACHE_SIZE = 128
+    
     def __init__(self, project_parser: ProjectParser = None, tmdl_writer: TMDLWriter = None):
-        self.project_parser = project_parser or ProjectParser()
-        self.tmdl_writer = tmdl_writer or TMDLWriter()
+        cls = type(self)
+        if cls._build_handlers is BaseOperation._build_handlers and cls.execute is BaseOperation.execute:
+            raise TypeError(f"{cls.__name__} must implement _build_handlers() or execute()")
+        self.project_parser = project_parser or get_project_parser()
+        self.tmdl_writer = tmdl_writer or get_tmdl_writer()
+        self._response_cache: "OrderedDict[Tuple, Tuple[Any, List[TextContent]]]" = OrderedDict()
+        self._model_dir_cache: Dict[str, Path] = {}
+        self._handlers = self._build_handlers()
+        for operation in self.READ_OPERATIONS & self._handlers.keys():
+            self._handlers[operation] = self._memoize_read(operation, self._handlers[operation])
+    
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        """Map operation types to the bound methods that handle them.
+        
+        Subclasses override this, or override execute() to dispatch themselves;
+        operation types missing from the table fall back to execute().
+        """
+        return {}
+    
+    def get_handler(self, operation: str) -> OperationHandler:
+        """Return the callable for an operation type, skipping execute() when possible."""
+        handler = self._handlers.get(operation)
+        if handler is None:
+            return partial(self.execute, operation)
+        return handler
+    
+    def _memoize_read(self, operation: str, handler: Callable[..., Awaitable[List[TextContent]]]) -> OperationHandler:
+        """Wrap a read-only handler so repeated calls on an unchanged project reuse its response.
+        
+        The handler must accept the already loaded project as a ``project`` keyword.
+        """
+        async def cached_handler(arguments: Dict[str, Any]) -> List[TextContent]:
+            project_path = arguments["project_path"]
+            try:
+                key = (project_path, operation, frozenset(arguments.items()))
+            except TypeError:
+                return await handler(arguments)
+            
+            # The parser returns the identical object until the project's files change
+            project = self._load_project(project_path)
+            cached = self._response_cache.get(key)
+            if cached is not None and cached[0] is project:
+                self._response_cache.move_to_end(key)
+                return cached[1]
+            
+            # Responses built from an older parse of this project would only pin it in memory
+            stale = [k for k, (p, _) in self._response_cache.items() if k[0] == project_path and p is not project]
+            for k in stale:
+                del self._response_cache[k]
+            
+            response = await handler(arguments, project=project)
+            self._response_cache[key] = (project, response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            return response
+        
+        return cached_handler
     
     def _load_project(self, project_path: str):
         """Load and validate project."""
@@ -37,7 +104,17 @@ class BaseOperation(ABC):
         return project
     
     def _get_semantic_model_path(self, project_path: str) -> Path:
-        """Get semantic model directory path."""
+        """Get semantic model directory path, reusing the last lookup while it still exists."""
+        cached = self._model_dir_cache.get(project_path)
+        if cached is not None and cached.is_dir():
+            return cached
+        
+        model_dir = self._find_semantic_model_path(project_path)
+        self._model_dir_cache[project_path] = model_dir
+        return model_dir
+    
+    def _find_semantic_model_path(self, project_path: str) -> Path:
+        """Locate the semantic model directory for a project path."""
         project_dir = Path(project_path)
         
         # Check if the path itself is a semantic model directory
@@ -50,9 +127,9 @@ class BaseOperation(ABC):
         
         # Find semantic model directory in project directory
         for pattern in ["*.SemanticModel", "*.Dataset"]:
-            dirs = list(project_dir.glob(pattern))
-            if dirs:
-                return dirs[0]
+            model_dir = next(project_dir.glob(pattern), None)
+            if model_dir is not None:
+                return model_dir
         
         raise ValueError("Semantic model directory not found")
     
@@ -70,11 +147,17 @@ class BaseOperation(ABC):
         with open(table_file, "r", encoding="utf-8") as f:
             return f.read()
     
-    def _write_table_file(self, project_path: str, table_name: str, content: str):
-        """Write table TMDL file content."""
+    def _write_table_file(self, project_path: str, table_name: str, content: str,
+                          original: str = None):
+        """Write table TMDL file content, skipping the write if it equals original."""
+        if original is not None and content == original:
+            return
+        
         table_file = self._get_table_file_path(project_path, table_name)
         with open(table_file, "w", encoding="utf-8") as f:
             f.write(content)
+        invalidate_tmdl_file(table_file)
+        self.project_parser.invalidate(str(table_file))
     
     def _success_response(self, data: Any, message: str = None) -> List[TextContent]:
         """Create standardized success response."""
@@ -82,14 +165,14 @@ class BaseOperation(ABC):
             return [TextContent(type="text", text=message)]
         
         if isinstance(data, (dict, list)):
-            return [TextContent(type="text", text=json.dumps(data, indent=2))]
+            return [TextContent(type="text", text=dumps(data))]
         
         return [TextContent(type="text", text=str(data))]
     
     def _error_response(self, message: str) -> List[TextContent]:
         """Create standardized error response."""
         error_data = {"error": message, "success": False}
-        return [TextContent(type="text", text=json.dumps(error_data, indent=2))]
+        return [TextContent(type="text", text=dumps(error_data))]
     
     def _validate_dax_syntax(self, expression: str) -> tuple[bool, str]:
         """Basic DAX syntax validation.
@@ -157,18 +240,11 @@ class BaseOperation(ABC):
         Returns:
             Name with surrounding quotes removed
         """
-        if not name:
-            return name
-            
-        # Remove surrounding single or double quotes
-        name = name.strip()
-        if ((name.startswith("'") and name.endswith("'")) or 
-            (name.startswith('"') and name.endswith('"'))):
-            return name[1:-1]
-        
-        return name
+        return normalize_element_name(name)
     
-    @abstractmethod
     async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute the specified operation."""
-        raise NotImplementedError("Subclasses must implement execute()")
\ No newline at end of file
+        handler = self._handlers.get(operation)
+        if handler is None:
+            return self._error_response(f"Unknown operation: {operation}")
+        return await handler(arguments)
\ No newline at end of file
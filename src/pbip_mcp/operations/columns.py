@@ -1,37 +1,38 @@
 """Column operations for PBIP MCP Server."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcp.types import TextContent
 
-from .base import BaseOperation, OperationType
+from ..models import ProjectStructure
+from .base import BaseOperation, OperationHandler, OperationType
 
 
 class ColumnOperations(BaseOperation):
     """Handle all column-related operations."""
     
-    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Execute the specified column operation."""
-        if operation == OperationType.LIST:
-            return await self.list_columns(arguments)
-        elif operation == OperationType.ADD:
-            return await self.add_column(arguments)
-        elif operation == OperationType.UPDATE:
-            return await self.update_column(arguments)
-        elif operation == OperationType.DELETE:
-            return await self.delete_column(arguments)
-        else:
-            return self._error_response(f"Unknown operation: {operation}")
+    READ_OPERATIONS = frozenset({OperationType.LIST})
+    
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        """Map column operation types to their handlers."""
+        return {
+            OperationType.LIST: self.list_columns,
+            OperationType.ADD: self.add_column,
+            OperationType.UPDATE: self.update_column,
+            OperationType.DELETE: self.delete_column,
+        }
     
-    async def list_columns(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def list_columns(self, arguments: Dict[str, Any],
+                           project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """List all columns in a table or all tables."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         table_name = arguments.get("table_name")  # Make optional
         
         if table_name:
             # Single table mode (existing behavior)
             normalized_table_name = self._normalize_element_name(table_name)
-            table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+            table = project.semantic_model.tables_by_name.get(normalized_table_name)
             if not table:
                 return self._error_response(f"Table '{table_name}' not found")
             
@@ -105,13 +106,13 @@ class ColumnOperations(BaseOperation):
         # Validate
         # Find table using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Check if column already exists using normalized name comparison
         normalized_input_name = self._normalize_element_name(column_name)
-        if any(self._normalize_element_name(c.name) == normalized_input_name for c in table.columns):
+        if normalized_input_name in table.columns_by_name:
             return self._error_response(f"Column '{column_name}' already exists in table '{table_name}'")
         
         # Read table file
@@ -137,7 +138,7 @@ class ColumnOperations(BaseOperation):
         updated_content = self.tmdl_writer.add_element(content, "column", column_def)
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
@@ -156,13 +157,13 @@ class ColumnOperations(BaseOperation):
         # Validate
         # Find table using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Find column using normalized name comparison
         normalized_input_name = self._normalize_element_name(column_name)
-        column = next((c for c in table.columns if self._normalize_element_name(c.name) == normalized_input_name), None)
+        column = table.columns_by_name.get(normalized_input_name)
         if not column:
             return self._error_response(f"Column '{column_name}' not found in table '{table_name}'")
         
@@ -203,7 +204,7 @@ class ColumnOperations(BaseOperation):
         updated_content = self.tmdl_writer.update_element(content, "column", actual_column_name, updates)
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
@@ -221,13 +222,13 @@ class ColumnOperations(BaseOperation):
         # Validate
         # Find table using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Find column using normalized name comparison
         normalized_input_name = self._normalize_element_name(column_name)
-        target_column = next((c for c in table.columns if self._normalize_element_name(c.name) == normalized_input_name), None)
+        target_column = table.columns_by_name.get(normalized_input_name)
         if not target_column:
             return self._error_response(f"Column '{column_name}' not found in table '{table_name}'")
         
@@ -239,7 +240,7 @@ class ColumnOperations(BaseOperation):
         updated_content = self.tmdl_writer.delete_element(content, "column", actual_column_name)
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
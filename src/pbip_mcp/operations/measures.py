@@ -1,32 +1,33 @@
 """Measure operations for PBIP MCP Server."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import uuid
 
 from mcp.types import TextContent
 
-from .base import BaseOperation, OperationType
+from ..models import ProjectStructure
+from .base import BaseOperation, OperationHandler, OperationType
 
 
 class MeasureOperations(BaseOperation):
     """Handle all measure-related operations."""
     
-    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Execute the specified measure operation."""
-        if operation == OperationType.LIST:
-            return await self.list_measures(arguments)
-        elif operation == OperationType.ADD:
-            return await self.add_measure(arguments)
-        elif operation == OperationType.UPDATE:
-            return await self.update_measure(arguments)
-        elif operation == OperationType.DELETE:
-            return await self.delete_measure(arguments)
-        else:
-            return self._error_response(f"Unknown operation: {operation}")
+    READ_OPERATIONS = frozenset({OperationType.LIST})
+    
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        """Map measure operation types to their handlers."""
+        return {
+            OperationType.LIST: self.list_measures,
+            OperationType.ADD: self.add_measure,
+            OperationType.UPDATE: self.update_measure,
+            OperationType.DELETE: self.delete_measure,
+        }
     
-    async def list_measures(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def list_measures(self, arguments: Dict[str, Any],
+                            project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """List all measures in the project or specific table."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         table_name = arguments.get("table_name")
         
         measures = []
@@ -85,14 +86,14 @@ class MeasureOperations(BaseOperation):
         
         # Validate table exists using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Check if measure already exists (across all tables)
         normalized_input_name = self._normalize_element_name(measure_name)
         for t in project.semantic_model.tables:
-            if any(self._normalize_element_name(m.name) == normalized_input_name for m in t.measures):
+            if normalized_input_name in t.measures_by_name:
                 return self._error_response(f"Measure '{measure_name}' already exists in table '{t.name}'")
         
         # Validate DAX expression
@@ -115,7 +116,7 @@ class MeasureOperations(BaseOperation):
         updated_content = self.tmdl_writer.add_element(content, "measure", measure_def)
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
@@ -132,13 +133,13 @@ class MeasureOperations(BaseOperation):
         
         # Find the table using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Find measure using normalized name comparison
         normalized_input_name = self._normalize_element_name(measure_name)
-        measure = next((m for m in table.measures if self._normalize_element_name(m.name) == normalized_input_name), None)
+        measure = table.measures_by_name.get(normalized_input_name)
         if not measure:
             return self._error_response(f"Measure '{measure_name}' not found in table '{table_name}'")
         
@@ -167,7 +168,7 @@ class MeasureOperations(BaseOperation):
             )
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
@@ -184,13 +185,13 @@ class MeasureOperations(BaseOperation):
         
         # Validate table exists using normalized name comparison
         normalized_table_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_table_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_table_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
         # Find measure using normalized name comparison
         normalized_input_name = self._normalize_element_name(measure_name)
-        target_measure = next((m for m in table.measures if self._normalize_element_name(m.name) == normalized_input_name), None)
+        target_measure = table.measures_by_name.get(normalized_input_name)
         if not target_measure:
             return self._error_response(f"Measure '{measure_name}' not found in table '{table_name}'")
         
@@ -202,7 +203,7 @@ class MeasureOperations(BaseOperation):
         updated_content = self.tmdl_writer.delete_element(content, "measure", actual_measure_name)
         
         # Write back
-        self._write_table_file(arguments["project_path"], table_name, updated_content)
+        self._write_table_file(arguments["project_path"], table_name, updated_content, content)
         
         return self._success_response({
             "success": True,
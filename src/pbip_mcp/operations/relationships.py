@@ -1,25 +1,29 @@
 """Relationship operations for PBIP MCP Server."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcp.types import TextContent
 
-from .base import BaseOperation, OperationType
+from ..models import ProjectStructure
+from .base import BaseOperation, OperationHandler, OperationType
 
 
 class RelationshipOperations(BaseOperation):
     """Handle relationship operations."""
     
-    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Execute the specified relationship operation."""
-        if operation == OperationType.LIST:
-            return await self.list_relationships(arguments)
-        else:
-            return self._error_response(f"Unknown operation: {operation}")
+    READ_OPERATIONS = frozenset({OperationType.LIST})
     
-    async def list_relationships(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        """Map relationship operation types to their handlers."""
+        return {
+            OperationType.LIST: self.list_relationships,
+        }
+    
+    async def list_relationships(self, arguments: Dict[str, Any],
+                                 project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """List all relationships in the project."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         
         relationships = []
         for rel in project.semantic_model.relationships:
@@ -1,29 +1,31 @@
 """Table operations for PBIP MCP Server."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcp.types import TextContent
 
-from .base import BaseOperation, OperationType
+from ..models import ProjectStructure
+from .base import BaseOperation, OperationHandler, OperationType
 
 
 class TableOperations(BaseOperation):
     """Handle table-level operations."""
     
-    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Execute the specified table operation."""
-        if operation == OperationType.LIST:
-            return await self.list_tables(arguments)
-        elif operation == OperationType.GET:
-            return await self.get_table_details(arguments)
-        elif operation == OperationType.GET_MODEL_DETAILS:
-            return await self.get_model_details(arguments)
-        else:
-            return self._error_response(f"Unknown operation: {operation}")
+    READ_OPERATIONS = frozenset({OperationType.LIST, OperationType.GET, OperationType.GET_MODEL_DETAILS})
     
-    async def list_tables(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        """Map table operation types to their handlers."""
+        return {
+            OperationType.LIST: self.list_tables,
+            OperationType.GET: self.get_table_details,
+            OperationType.GET_MODEL_DETAILS: self.get_model_details,
+        }
+    
+    async def list_tables(self, arguments: Dict[str, Any],
+                          project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """List all tables in the project."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         
         tables = []
         for table in project.semantic_model.tables:
@@ -43,14 +45,16 @@ class TableOperations(BaseOperation):
             "tables": tables
         })
     
-    async def get_table_details(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def get_table_details(self, arguments: Dict[str, Any],
+                                project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """Get detailed information about a table."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         table_name = arguments["table_name"]
         
         # Find table using normalized name comparison
         normalized_input_name = self._normalize_element_name(table_name)
-        table = next((t for t in project.semantic_model.tables if self._normalize_element_name(t.name) == normalized_input_name), None)
+        table = project.semantic_model.tables_by_name.get(normalized_input_name)
         if not table:
             return self._error_response(f"Table '{table_name}' not found")
         
@@ -114,9 +118,11 @@ class TableOperations(BaseOperation):
         
         return self._success_response(result)
     
-    async def get_model_details(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def get_model_details(self, arguments: Dict[str, Any],
+                                project: Optional[ProjectStructure] = None) -> List[TextContent]:
         """Get comprehensive details of the entire semantic model."""
-        project = self._load_project(arguments["project_path"])
+        if project is None:
+            project = self._load_project(arguments["project_path"])
         
         # Collect detailed statistics
         total_tables = len(project.semantic_model.tables)
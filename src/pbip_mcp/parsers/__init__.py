@@ -1,6 +1,15 @@
 """PBIP file parsers package."""
 
-from .tmdl_parser import TMDLParser
-from .project_parser import ProjectParser, ProjectParseError
+from .tmdl_parser import TMDLParser, TMDLParseError, invalidate_tmdl_file, parse_tmdl_file
+from .project_parser import ProjectParser, ProjectParseError, ProjectNotFoundError, get_project_parser
 
-__all__ = ["TMDLParser", "ProjectParser", "ProjectParseError"]
+__all__ = [
+    "TMDLParser",
+    "TMDLParseError",
+    "parse_tmdl_file",
+    "invalidate_tmdl_file",
+    "ProjectParser",
+    "ProjectParseError",
+    "ProjectNotFoundError",
+    "get_project_parser",
+]
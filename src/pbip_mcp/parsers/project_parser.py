@@ -1,34 +1,120 @@
 """PBIP project parser for loading complete project structures."""
 
 import json
+import os
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 from ..models import ProjectStructure, ProjectInfo, SemanticModel, Platform
-from .tmdl_parser import TMDLParser, TMDLParseError
+from .tmdl_parser import TMDLParseError, parse_tmdl_file
 
 logger = logging.getLogger(__name__)
 
 
+def _tree_stamp(root: str) -> Tuple:
+    """Snapshot (path, mtime, size) for every file under root.
+
+    Any edit, addition or removal below root produces a different stamp.
+    """
+    stamp = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                st = entry.stat()
+            except OSError:
+                # e.g. a dangling symlink; skip just this entry
+                continue
+            stamp.append((entry.path, st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
 class ProjectParseError(Exception):
     """Error parsing PBIP project."""
 
     pass
 
 
+class ProjectNotFoundError(ProjectParseError):
+    """The given path does not exist or holds no PBIP project or semantic model."""
+
+    pass
+
+
 class ProjectParser:
     """Parser for complete PBIP projects."""
 
-    def __init__(self):
-        self.tmdl_parser = TMDLParser()
+    def __init__(self, cache_size: int = 32):
+        # Least recently used projects are evicted once cache_size is exceeded
+        self.cache_size = cache_size
+        # real path -> (stamped root directory, stamp, project)
+        self._project_cache: "OrderedDict[str, Tuple[str, Tuple, ProjectStructure]]" = OrderedDict()
 
     def load_project(self, project_path: str) -> ProjectStructure:
+        """Load complete PBIP project, reusing the last result while its files are unchanged.
+
+        The returned structure is shared with the cache and must be treated as read-only.
+        """
+        real_path = os.path.realpath(project_path)
+        if not os.path.exists(real_path):
+            raise ProjectNotFoundError(f"Project path does not exist: {project_path}")
+
+        # Everything load_project reads (including the .platform rglob) lives
+        # under the project directory, or the parent of a .SemanticModel dir
+        if os.path.isfile(real_path) or real_path.endswith(".SemanticModel"):
+            root = os.path.dirname(real_path)
+        else:
+            root = real_path
+        stamp = _tree_stamp(root)
+
+        cached = self._project_cache.get(real_path)
+        if cached is not None and cached[1] == stamp:
+            self._project_cache.move_to_end(real_path)
+            return cached[2]
+
+        project = self._load_project_uncached(project_path)
+        if self.cache_size > 0:
+            self._project_cache[real_path] = (root, stamp, project)
+            self._project_cache.move_to_end(real_path)
+            while len(self._project_cache) > self.cache_size:
+                self._project_cache.popitem(last=False)
+        return project
+
+    def clear_cache(self):
+        """Drop all cached projects."""
+        self._project_cache.clear()
+
+    def invalidate(self, path: str):
+        """Drop cached projects whose files include path, leaving other projects cached."""
+        real_path = os.path.realpath(path)
+        stale = []
+        for key, (root, _, _) in self._project_cache.items():
+            try:
+                if os.path.commonpath((root, real_path)) == root:
+                    stale.append(key)
+            except ValueError:  # different drives
+                continue
+        for key in stale:
+            del self._project_cache[key]
+
+    def _load_project_uncached(self, project_path: str) -> ProjectStructure:
         """Load complete PBIP project from file path or standalone semantic model."""
         project_dir = Path(project_path)
 
         if not project_dir.exists():
-            raise ProjectParseError(f"Project path does not exist: {project_path}")
+            raise ProjectNotFoundError(f"Project path does not exist: {project_path}")
 
         # Check if this is a standalone semantic model directory
         if project_dir.is_dir() and project_dir.name.endswith(".SemanticModel"):
@@ -47,7 +133,7 @@ class ProjectParser:
                 semantic_model_dirs = list(project_dir.glob("*.SemanticModel"))
                 if semantic_model_dirs:
                     return self._load_semantic_model_only(semantic_model_dirs[0])
-                raise ProjectParseError(f"No .pbip file or .SemanticModel directory found in {project_path}")
+                raise ProjectNotFoundError(f"No .pbip file or .SemanticModel directory found in {project_path}")
             pbip_file = pbip_files[0]
 
         # Load project info from .pbip file
@@ -84,7 +170,7 @@ class ProjectParser:
 
             return ProjectInfo(**data)
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            raise ProjectParseError(f"Error loading project file {pbip_file}: {e}")
+            raise ProjectParseError(f"Error loading project file {pbip_file}: {e}") from e
 
     def _find_semantic_model_dir(
         self, project_dir: Path, project_name: str
@@ -103,11 +189,7 @@ class ProjectParser:
                 return dir_path
 
         # Look for any .SemanticModel directories
-        semantic_dirs = list(project_dir.glob("*.SemanticModel"))
-        if semantic_dirs:
-            return semantic_dirs[0]
-
-        return None
+        return next(project_dir.glob("*.SemanticModel"), None)
 
     def _load_semantic_model(self, semantic_model_dir: Path) -> Optional[SemanticModel]:
         """Load semantic model from directory."""
@@ -121,10 +203,7 @@ class ProjectParser:
             if not model_file.exists():
                 return None
 
-            with open(model_file, "r", encoding="utf-8") as f:
-                model_content = f.read()
-
-            model_data = self.tmdl_parser.parse_file(model_content)
+            model_data = self._parse_tmdl_file(model_file)
             model_info = model_data.get("model", {})
 
             # Initialize semantic model
@@ -206,15 +285,16 @@ class ProjectParser:
             return semantic_model
 
         except Exception as e:
-            raise ProjectParseError(f"Error loading semantic model: {e}")
+            raise ProjectParseError(f"Error loading semantic model: {e}") from e
+
+    def _parse_tmdl_file(self, tmdl_file: Path) -> Dict[str, Any]:
+        """Read a TMDL file and parse its content."""
+        return parse_tmdl_file(tmdl_file)
 
     def _load_table(self, table_file: Path) -> Optional[Dict[str, Any]]:
         """Load table definition from TMDL file."""
         try:
-            with open(table_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            parsed = self.tmdl_parser.parse_file(content)
+            parsed = self._parse_tmdl_file(table_file)
             tables = parsed.get("tables", [])
 
             if tables:
@@ -361,10 +441,7 @@ class ProjectParser:
     def _load_relationships(self, relationships_file: Path) -> List[Dict[str, Any]]:
         """Load relationships from TMDL file."""
         try:
-            with open(relationships_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            parsed = self.tmdl_parser.parse_file(content)
+            parsed = self._parse_tmdl_file(relationships_file)
             return parsed.get("relationships", [])
 
         except Exception as e:
@@ -374,10 +451,7 @@ class ProjectParser:
     def _load_culture(self, culture_file: Path) -> Optional[Dict[str, Any]]:
         """Load culture info from TMDL file."""
         try:
-            with open(culture_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            parsed = self.tmdl_parser.parse_file(content)
+            parsed = self._parse_tmdl_file(culture_file)
             culture_infos = parsed.get("culture_infos", [])
 
             if culture_infos:
@@ -392,10 +466,7 @@ class ProjectParser:
     def _load_database(self, database_file: Path) -> Optional[Dict[str, Any]]:
         """Load database info from TMDL file."""
         try:
-            with open(database_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            parsed = self.tmdl_parser.parse_file(content)
+            parsed = self._parse_tmdl_file(database_file)
             return parsed.get("database", {})
 
         except Exception as e:
@@ -496,7 +567,7 @@ class ProjectParser:
         directory_path = Path(directory)
 
         if not directory_path.exists():
-            raise ProjectParseError(f"Directory does not exist: {directory}")
+            raise ProjectNotFoundError(f"Directory does not exist: {directory}")
 
         projects = []
 
@@ -566,4 +637,10 @@ class ProjectParser:
             )
             
         except Exception as e:
-            raise ProjectParseError(f"Error loading standalone semantic model: {e}")
+            raise ProjectParseError(f"Error loading standalone semantic model: {e}") from e
+
+
+@cache
+def get_project_parser() -> ProjectParser:
+    """Return the process-wide shared ProjectParser."""
+    return ProjectParser()
@@ -1,6 +1,8 @@
 """TMDL (Tabular Model Definition Language) parser."""
 
+import os
 import re
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..models import (
@@ -32,23 +34,50 @@ class TMDLParseError(Exception):
         super().__init__(f"Line {line_number}: {message}" if line_number else message)
 
 
+def _compute_indents(lines: List[str]) -> List[int]:
+    """Count leading tabs/spaces for every line in a single pass."""
+    return [len(line) - len(line.lstrip("\t ")) for line in lines]
+
+
 class TMDLParser:
     """Parser for TMDL files."""
 
     def __init__(self):
         self.current_line = 0
         self.lines: List[str] = []
+        # Per-line records built once up front, parallel to self.lines
+        self.stripped_lines: List[str] = []
+        self.line_indents: List[int] = []
         self.description_buffer: List[str] = []
 
     def parse_file(self, content: str) -> Dict[str, Any]:
         """Parse TMDL file content."""
+        self._tokenize(content)
+        try:
+            return self._parse_lines()
+        finally:
+            # Don't keep the last file's lines alive between parses
+            self._release_lines()
+
+    def _tokenize(self, content: str):
+        """Split content into lines with their stripped text and indentation."""
         self.lines = content.split("\n")
+        self.stripped_lines = [line.strip() for line in self.lines]
+        self.line_indents = _compute_indents(self.lines)
         self.current_line = 0
 
+    def _release_lines(self):
+        """Drop per-file line records once parsing is done."""
+        self.lines = []
+        self.stripped_lines = []
+        self.line_indents = []
+
+    def _parse_lines(self) -> Dict[str, Any]:
+        """Parse the tokenized top-level elements."""
         result = {}
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line().strip()
+            line = self.stripped_lines[self.current_line]
 
             if not line:
                 self._advance_line()
@@ -112,7 +141,7 @@ class TMDLParser:
                 culture_name = line.replace("ref cultureInfo ", "").strip()
                 result["culture_refs"].append(culture_name)
                 self._advance_line()
-            elif line.strip() and not line.startswith("//"):
+            elif line and not line.startswith("//"):
                 # Unrecognized syntax that isn't empty or comment
                 # Clear description buffer on unrecognized lines
                 self.description_buffer.clear()
@@ -126,23 +155,19 @@ class TMDLParser:
 
         return result
 
-    def _get_current_line(self) -> str:
-        """Get current line content."""
+    def _get_current_content(self) -> str:
+        """Get current line content without surrounding whitespace."""
         if self.current_line >= len(self.lines):
             return ""
-        return self.lines[self.current_line]
+        return self.stripped_lines[self.current_line]
 
     def _advance_line(self):
         """Move to next line."""
         self.current_line += 1
 
-    def _get_indentation(self, line: str) -> int:
-        """Get indentation level of line."""
-        return len(line) - len(line.lstrip("\t "))
-
     def _parse_model(self) -> Dict[str, Any]:
         """Parse model definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"model\s+(.+)", line)
         if not match:
             raise TMDLParseError("Invalid model definition", self.current_line + 1)
@@ -161,23 +186,21 @@ class TMDLParser:
             "annotations": [],
         }
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None:
+            if base_indent < 0:
                 base_indent = indent
             elif indent <= 0:  # Back to top level
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("culture:"):
                 model["culture"] = self._parse_property_value(line_content)
             elif line_content.startswith("defaultPowerBIDataSourceVersion:"):
@@ -211,7 +234,7 @@ class TMDLParser:
 
     def _parse_table(self) -> Dict[str, Any]:
         """Parse table definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"table\s+(.+)", line)
         if not match:
             raise TMDLParseError("Invalid table definition", self.current_line + 1)
@@ -234,23 +257,21 @@ class TMDLParser:
             "show_as_variations_only": False,
         }
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif indent <= 0:  # Back to top level
                 break
 
-            line_content = line.strip()
-            
             # Handle triple-slash comments inside table
             if line_content.startswith("///"):
                 desc_text = line_content[3:].strip()
@@ -314,7 +335,7 @@ class TMDLParser:
 
     def _parse_column(self) -> Dict[str, Any]:
         """Parse column definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
 
         # Handle both regular columns and calculated columns
         if " = " in line:
@@ -357,27 +378,24 @@ class TMDLParser:
         if is_calculated:
             column["expression"] = expression
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif (
                 indent <= base_indent
-                and line.strip()
-                and not line.strip().startswith(("annotation", "variation"))
+                and not line_content.startswith(("annotation", "variation"))
             ):
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("dataType:"):
                 column["data_type"] = self._parse_property_value(line_content)
             elif line_content.startswith("lineageTag:"):
@@ -409,7 +427,7 @@ class TMDLParser:
 
     def _parse_measure(self) -> Optional[Dict[str, Any]]:
         """Parse measure definition with error recovery."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"measure\s+(.+?)\s*=\s*(.+)", line)
         if not match:
             # Try to skip malformed measure and continue parsing
@@ -438,27 +456,24 @@ class TMDLParser:
             "is_hidden": False,
         }
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif (
                 indent <= base_indent
-                and line.strip()
-                and not line.strip().startswith("annotation")
+                and not line_content.startswith("annotation")
             ):
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("lineageTag:"):
                 measure["lineage_tag"] = self._parse_property_value(line_content)
             elif line_content.startswith("formatString:"):
@@ -483,19 +498,19 @@ class TMDLParser:
     
     def _skip_measure_properties(self):
         """Skip properties belonging to a malformed measure."""
-        base_indent = None
+        base_indent = -1
         
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
-                
-            indent = self._get_indentation(line)
+
+            indent = self.line_indents[self.current_line]
             
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
-            elif indent <= base_indent and line.strip():
+            elif indent <= base_indent:
                 # We've reached the next element at the same or lower level
                 break
                 
@@ -503,7 +518,7 @@ class TMDLParser:
 
     def _parse_relationship(self) -> Dict[str, Any]:
         """Parse relationship definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"relationship\s+(.+)", line)
         if not match:
             raise TMDLParseError(
@@ -515,23 +530,21 @@ class TMDLParser:
 
         relationship = {"name": relationship_name, "is_active": True}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif indent <= 0:
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("fromColumn:"):
                 from_ref = self._parse_property_value(line_content)
                 if "." in from_ref:
@@ -565,7 +578,7 @@ class TMDLParser:
 
     def _parse_annotation(self) -> Dict[str, Any]:
         """Parse annotation."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"annotation\s+(.+?)\s*=\s*(.+)", line)
         if not match:
             raise TMDLParseError("Invalid annotation definition", self.current_line + 1)
@@ -621,27 +634,24 @@ class TMDLParser:
 
         calc_group = {"calculation_items": []}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif (
                 indent <= base_indent
-                and line.strip()
-                and not line.strip().startswith("calculationItem")
+                and not line_content.startswith("calculationItem")
             ):
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("precedence:"):
                 calc_group["precedence"] = int(self._parse_property_value(line_content))
             elif line_content.startswith("calculationItem "):
@@ -654,7 +664,7 @@ class TMDLParser:
 
     def _parse_calculation_item(self) -> Dict[str, Any]:
         """Parse calculation item."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
 
         if " = " in line:
             # calculationItem Name = Expression (could be single line or start of multiline)
@@ -712,33 +722,31 @@ class TMDLParser:
     def _parse_multiline_expression(self) -> str:
         """Parse multi-line expression (typically DAX)."""
         expression_lines = []
-        base_indent = None
+        base_indent = -1
         found_content = False
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None:
-                # Find the first line with actual content to set base indent
-                if line.strip():
-                    base_indent = indent
-                    found_content = True
+            if base_indent < 0:
+                # First line with actual content sets the base indent
+                base_indent = indent
+                found_content = True
             elif indent < base_indent and found_content:
                 # We've moved back to a lower indentation level
                 break
 
             # Remove the base indentation and add to expression
-            if line.strip() and base_indent is not None:
-                cleaned_line = (
-                    line[base_indent:] if len(line) > base_indent else line.strip()
-                )
-                expression_lines.append(cleaned_line)
+            line = self.lines[self.current_line]
+            cleaned_line = (
+                line[base_indent:] if len(line) > base_indent else line_content
+            )
+            expression_lines.append(cleaned_line)
 
             self._advance_line()
 
@@ -746,12 +754,8 @@ class TMDLParser:
 
     def _parse_hierarchy(self) -> Dict[str, Any]:
         """Parse hierarchy definition."""
-        line = self._get_current_line().strip()
-        match = re.match(r"hierarchy\s+(.+)", line)
-        if not match:
-            raise TMDLParseError("Invalid hierarchy definition", self.current_line + 1)
-
-        hierarchy_name = match.group(1).strip()
+        # Caller already dispatched on the "hierarchy " prefix
+        hierarchy_name = self._get_current_content()[len("hierarchy ") :].strip()
 
         # Remove quotes if present
         if (hierarchy_name.startswith("'") and hierarchy_name.endswith("'")) or (
@@ -768,27 +772,24 @@ class TMDLParser:
             "annotations": [],
         }
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif (
                 indent <= base_indent
-                and line.strip()
-                and not line.strip().startswith(("level", "annotation"))
+                and not line_content.startswith(("level", "annotation"))
             ):
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("lineageTag:"):
                 hierarchy["lineage_tag"] = self._parse_property_value(line_content)
             elif line_content.startswith("level "):
@@ -804,35 +805,27 @@ class TMDLParser:
 
     def _parse_hierarchy_level(self) -> Dict[str, Any]:
         """Parse hierarchy level."""
-        line = self._get_current_line().strip()
-        match = re.match(r"level\s+(.+)", line)
-        if not match:
-            raise TMDLParseError(
-                "Invalid hierarchy level definition", self.current_line + 1
-            )
-
-        level_name = match.group(1)
+        # Caller already dispatched on the "level " prefix
+        level_name = self._get_current_content()[len("level ") :].lstrip()
         self._advance_line()
 
         level = {"name": level_name, "lineage_tag": "", "column": ""}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
-            elif indent <= base_indent and line.strip():
+            elif indent <= base_indent:
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("lineageTag:"):
                 level["lineage_tag"] = self._parse_property_value(line_content)
             elif line_content.startswith("column:"):
@@ -844,7 +837,7 @@ class TMDLParser:
 
     def _parse_partition(self) -> Dict[str, Any]:
         """Parse partition definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
 
         if " = " in line:
             # partition Name = mode
@@ -871,27 +864,24 @@ class TMDLParser:
 
         partition = {"name": partition_name, "mode": mode, "source": ""}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif (
                 indent <= base_indent
-                and line.strip()
-                and not line.strip().startswith("source")
+                and not line_content.startswith("source")
             ):
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("mode:"):
                 partition["mode"] = self._parse_property_value(line_content)
             elif line_content.startswith("source"):
@@ -904,7 +894,7 @@ class TMDLParser:
 
     def _parse_source(self) -> str:
         """Parse partition source (M query or DAX)."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
 
         if line.startswith("source ="):
             # Single line source
@@ -918,33 +908,27 @@ class TMDLParser:
 
     def _parse_variation(self) -> Dict[str, Any]:
         """Parse column variation."""
-        line = self._get_current_line().strip()
-        match = re.match(r"variation\s+(.+)", line)
-        if not match:
-            raise TMDLParseError("Invalid variation definition", self.current_line + 1)
-
-        variation_name = match.group(1)
+        # Caller already dispatched on the "variation " prefix
+        variation_name = self._get_current_content()[len("variation ") :].lstrip()
         self._advance_line()
 
         variation = {"name": variation_name, "is_default": False}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
-            elif indent <= base_indent and line.strip():
+            elif indent <= base_indent:
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("isDefault"):
                 variation["is_default"] = True
             elif line_content.startswith("relationship:"):
@@ -960,7 +944,7 @@ class TMDLParser:
 
     def _parse_culture_info(self) -> Dict[str, Any]:
         """Parse culture info definition."""
-        line = self._get_current_line().strip()
+        line = self._get_current_content()
         match = re.match(r"cultureInfo\s+(.+)", line)
         if not match:
             raise TMDLParseError(
@@ -972,23 +956,21 @@ class TMDLParser:
 
         culture = {"name": culture_name}
 
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None and line.strip():
+            if base_indent < 0:
                 base_indent = indent
             elif indent <= 0:
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("linguisticMetadata"):
                 culture["linguistic_metadata"] = self._parse_linguistic_metadata()
                 continue
@@ -1007,23 +989,22 @@ class TMDLParser:
     def _parse_json_block(self) -> Dict[str, Any]:
         """Parse a JSON block."""
         json_lines = []
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None:
+            if base_indent < 0:
                 base_indent = indent
             elif indent < base_indent:
                 break
 
-            json_lines.append(line.strip())
+            json_lines.append(line_content)
             self._advance_line()
 
         try:
@@ -1041,17 +1022,15 @@ class TMDLParser:
         database = {}
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
             if indent <= 0:
                 break
 
-            line_content = line.strip()
-
             if line_content.startswith("compatibilityLevel:"):
                 database["compatibility_level"] = int(
                     self._parse_property_value(line_content)
@@ -1066,23 +1045,21 @@ class TMDLParser:
         self._advance_line()  # Skip the dataAccessOptions line
 
         options = {}
-        base_indent = None
+        base_indent = -1
 
         while self.current_line < len(self.lines):
-            line = self._get_current_line()
-            if not line.strip():
+            line_content = self.stripped_lines[self.current_line]
+            if not line_content:
                 self._advance_line()
                 continue
 
-            indent = self._get_indentation(line)
+            indent = self.line_indents[self.current_line]
 
-            if base_indent is None:
+            if base_indent < 0:
                 base_indent = indent
             elif indent < base_indent:
                 break
 
-            line_content = line.strip()
-
             if line_content == "legacyRedirects":
                 options["legacy_redirects"] = True
             elif line_content == "returnErrorValuesAsNull":
@@ -1103,3 +1080,46 @@ class TMDLParser:
                 return value[1:-1]
             return value
         return ""
+
+
+# Absolute path -> ((mtime_ns, size), parsed result), least recently used first.
+# Sized to hold every table file of several large models at once.
+_PARSE_CACHE_SIZE = 512
+_parse_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+
+
+def parse_tmdl_file(path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Parse a TMDL file, reusing the previous result while it is unchanged.
+
+    The returned dict is shared with the cache and must be treated as read-only.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _parse_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        _parse_cache.move_to_end(path)
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    result = TMDLParser().parse_file(content)
+    _parse_cache[path] = (stamp, result)
+    _parse_cache.move_to_end(path)
+    while len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    return result
+
+
+def invalidate_tmdl_file(path: Optional[Union[str, os.PathLike]] = None):
+    """Drop the cached parse of one file, or of every file when path is None.
+
+    Writers must call this: a rewrite within the same mtime tick that keeps
+    the file size would otherwise still match the old stamp.
+    """
+    if path is None:
+        _parse_cache.clear()
+    else:
+        _parse_cache.pop(os.path.abspath(path), None)
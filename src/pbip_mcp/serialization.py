@@ -0,0 +1,25 @@
+"""JSON serialization for tool responses."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    # Non-str keys (e.g. None in summary counts) match json's "null" output.
+    # orjson always emits UTF-8, so non-ASCII names are not \u-escaped here.
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to indented JSON text."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+else:
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to indented JSON text."""
+        return json.dumps(obj, indent=2)
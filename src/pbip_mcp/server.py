@@ -1,15 +1,18 @@
 """Simplified and extensible PBIP MCP Server."""
 
 import asyncio
-import json
 import logging
+import os
+import sys
+from pathlib import Path
 from typing import Any, Dict, List, Type
 
 from mcp.server import Server
 from mcp.types import Resource, TextContent, Tool
 
-from .parsers import ProjectParser
-from .writers import TMDLWriter
+from .parsers import ProjectNotFoundError, TMDLParseError, get_project_parser
+from .serialization import dumps
+from .writers import get_tmdl_writer
 from .operations import (
     BaseOperation,
     OperationType,
@@ -23,16 +26,171 @@ from .operations import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Errors raised for bad arguments or missing project content; logged without traceback.
+# Other ProjectParseErrors wrap unexpected failures while loading and keep theirs.
+_EXPECTED_ERRORS = (ValueError, FileNotFoundError, ProjectNotFoundError, TMDLParseError)
+
+
+# Tool input schemas, built once per process and shared by every registry build
+_PROJECT_PATH = {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"}
+_MEASURE_TABLE = {"type": "string", "description": "Table containing the measure"}
+_COLUMN_TABLE = {"type": "string", "description": "Table containing the column"}
+
+_TOOL_SCHEMAS = {
+    "list_measures": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": {"type": "string", "description": "Filter by table name (optional)"}
+        },
+        "required": ["project_path"]
+    },
+    "add_measure": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": {"type": "string", "description": "Table to add measure to"},
+            "measure_name": {"type": "string", "description": "Name of the new measure"},
+            "expression": {"type": "string", "description": "DAX expression"},
+            "description": {"type": "string", "description": "Measure description (optional)"},
+            "format_string": {"type": "string", "description": "Format string (optional)"}
+        },
+        "required": ["project_path", "table_name", "measure_name", "expression"]
+    },
+    "update_measure": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": _MEASURE_TABLE,
+            "measure_name": {"type": "string", "description": "Name of the measure to update"},
+            "expression": {"type": "string", "description": "New DAX expression (optional)"},
+            "description": {"type": "string", "description": "New description (optional)"},
+            "format_string": {"type": "string", "description": "New format string (optional)"}
+        },
+        "required": ["project_path", "table_name", "measure_name"]
+    },
+    "delete_measure": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": _MEASURE_TABLE,
+            "measure_name": {"type": "string", "description": "Name of the measure to delete"}
+        },
+        "required": ["project_path", "table_name", "measure_name"]
+    },
+    "list_columns": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": {"type": "string", "description": "Table name (optional - omit to get all columns from all tables)"}
+        },
+        "required": ["project_path"]
+    },
+    "add_column": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": {"type": "string", "description": "Table to add column to"},
+            "column_name": {"type": "string", "description": "Name of the new column"},
+            "data_type": {"type": "string", "description": "Data type (string, int64, double, boolean, dateTime)", "default": "string"},
+            "expression": {"type": "string", "description": "DAX expression for calculated column (optional)"},
+            "format_string": {"type": "string", "description": "Format string (optional)"},
+            "summarize_by": {"type": "string", "description": "Summarization type (none, sum, count, min, max, average)"},
+            "is_hidden": {"type": "boolean", "description": "Hide column (optional)", "default": False}
+        },
+        "required": ["project_path", "table_name", "column_name"]
+    },
+    "update_column": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": _COLUMN_TABLE,
+            "column_name": {"type": "string", "description": "Name of the column to update"},
+            "data_type": {"type": "string", "description": "New data type (optional)"},
+            "expression": {"type": "string", "description": "New DAX expression for calculated column (optional)"},
+            "format_string": {"type": "string", "description": "New format string (optional)"},
+            "summarize_by": {"type": "string", "description": "New summarization type (optional)"},
+            "is_hidden": {"type": "boolean", "description": "Hide/show column (optional)"}
+        },
+        "required": ["project_path", "table_name", "column_name"]
+    },
+    "delete_column": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": _COLUMN_TABLE,
+            "column_name": {"type": "string", "description": "Name of the column to delete"}
+        },
+        "required": ["project_path", "table_name", "column_name"]
+    },
+    "list_tables": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH
+        },
+        "required": ["project_path"]
+    },
+    "get_table_details": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH,
+            "table_name": {"type": "string", "description": "Table name"}
+        },
+        "required": ["project_path", "table_name"]
+    },
+    "get_model_details": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH
+        },
+        "required": ["project_path"]
+    },
+    "list_relationships": {
+        "type": "object",
+        "properties": {
+            "project_path": _PROJECT_PATH
+        },
+        "required": ["project_path"]
+    },
+    "list_projects": {
+        "type": "object",
+        "properties": {
+            "directory": {"type": "string", "description": "Directory path to scan for PBIP projects and standalone .SemanticModel directories"}
+        },
+        "required": ["directory"]
+    },
+    "load_project": {
+        "type": "object",
+        "properties": {
+            "project_path": {"type": "string", "description": "Path to PBIP project file, directory, or .SemanticModel directory"}
+        },
+        "required": ["project_path"]
+    },
+}
+
 
 class SimplifiedPBIPServer:
     """Simplified PBIP MCP Server with clean, extensible architecture."""
     
+    __slots__ = (
+        "app",
+        "project_parser",
+        "tmdl_writer",
+        "operations",
+        "tools",
+        "_tool_index",
+        "_tool_handlers",
+        "_tool_objects",
+        "_help_text",
+        "_tmdl_guide",
+    )
+    
     def __init__(self):
         self.app = Server("pbip-mcp-server")
         
         # Shared dependencies
-        self.project_parser = ProjectParser()
-        self.tmdl_writer = TMDLWriter()
+        self.project_parser = get_project_parser()
+        self.tmdl_writer = get_tmdl_writer()
         
         # Initialize operation handlers
         self.operations = {
@@ -43,7 +201,10 @@ class SimplifiedPBIPServer:
         }
         
         # Build tool registry
-        self.tools = self._build_tool_registry()
+        self._rebuild_tools()
+        
+        # Static resource content
+        self._tmdl_guide = self._get_tmdl_syntax_guide()
         
         # Register MCP handlers
         self._register_handlers()
@@ -52,7 +213,25 @@ class SimplifiedPBIPServer:
         """Register a new operation handler - makes it easy to extend."""
         self.operations[name] = handler_class(self.project_parser, self.tmdl_writer)
         # Rebuild tool registry to include new operations
+        self._rebuild_tools()
+    
+    def _rebuild_tools(self):
+        """Build the tool registry, its dispatch arrays and the help text."""
         self.tools = self._build_tool_registry()
+        
+        # Parallel arrays indexed through _tool_index for call_tool/list_tools
+        self._tool_index = {}
+        handlers = []
+        for index, (name, tool_info) in enumerate(self.tools.items()):
+            self._tool_index[name] = index
+            if "handler" in tool_info:
+                handlers.append(tool_info["handler"])
+            else:
+                handlers.append(tool_info["operation"].get_handler(tool_info["operation_type"]))
+        self._tool_handlers = tuple(handlers)
+        self._tool_objects = tuple(tool_info["tool"] for tool_info in self.tools.values())
+        
+        self._help_text = self._build_help_text()
     
     def _build_tool_registry(self) -> Dict[str, Dict[str, Any]]:
         """Build tool registry from registered operations."""
@@ -61,72 +240,39 @@ class SimplifiedPBIPServer:
         # Measure tools
         tools.update({
             "list_measures": {
-                "handler": lambda args: self.operations["measure"].execute(OperationType.LIST, args),
+                "operation": self.operations["measure"],
+                "operation_type": OperationType.LIST,
                 "tool": Tool(
                     name="list_measures",
                     description="List all measures in the project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Filter by table name (optional)"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["list_measures"]
                 )
             },
             "add_measure": {
-                "handler": lambda args: self.operations["measure"].execute(OperationType.ADD, args),
+                "operation": self.operations["measure"],
+                "operation_type": OperationType.ADD,
                 "tool": Tool(
                     name="add_measure",
                     description="Add a new measure to a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table to add measure to"},
-                            "measure_name": {"type": "string", "description": "Name of the new measure"},
-                            "expression": {"type": "string", "description": "DAX expression"},
-                            "description": {"type": "string", "description": "Measure description (optional)"},
-                            "format_string": {"type": "string", "description": "Format string (optional)"}
-                        },
-                        "required": ["project_path", "table_name", "measure_name", "expression"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["add_measure"]
                 )
             },
             "update_measure": {
-                "handler": lambda args: self.operations["measure"].execute(OperationType.UPDATE, args),
+                "operation": self.operations["measure"],
+                "operation_type": OperationType.UPDATE,
                 "tool": Tool(
                     name="update_measure",
                     description="Update an existing measure",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table containing the measure"},
-                            "measure_name": {"type": "string", "description": "Name of the measure to update"},
-                            "expression": {"type": "string", "description": "New DAX expression (optional)"},
-                            "description": {"type": "string", "description": "New description (optional)"},
-                            "format_string": {"type": "string", "description": "New format string (optional)"}
-                        },
-                        "required": ["project_path", "table_name", "measure_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["update_measure"]
                 )
             },
             "delete_measure": {
-                "handler": lambda args: self.operations["measure"].execute(OperationType.DELETE, args),
+                "operation": self.operations["measure"],
+                "operation_type": OperationType.DELETE,
                 "tool": Tool(
                     name="delete_measure",
                     description="Delete a measure from a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table containing the measure"},
-                            "measure_name": {"type": "string", "description": "Name of the measure to delete"}
-                        },
-                        "required": ["project_path", "table_name", "measure_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["delete_measure"]
                 )
             },
         })
@@ -134,76 +280,39 @@ class SimplifiedPBIPServer:
         # Column tools
         tools.update({
             "list_columns": {
-                "handler": lambda args: self.operations["column"].execute(OperationType.LIST, args),
+                "operation": self.operations["column"],
+                "operation_type": OperationType.LIST,
                 "tool": Tool(
                     name="list_columns",
                     description="List all columns in a table or all tables (if table_name omitted)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table name (optional - omit to get all columns from all tables)"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["list_columns"]
                 )
             },
             "add_column": {
-                "handler": lambda args: self.operations["column"].execute(OperationType.ADD, args),
+                "operation": self.operations["column"],
+                "operation_type": OperationType.ADD,
                 "tool": Tool(
                     name="add_column",
                     description="Add a new column to a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table to add column to"},
-                            "column_name": {"type": "string", "description": "Name of the new column"},
-                            "data_type": {"type": "string", "description": "Data type (string, int64, double, boolean, dateTime)", "default": "string"},
-                            "expression": {"type": "string", "description": "DAX expression for calculated column (optional)"},
-                            "format_string": {"type": "string", "description": "Format string (optional)"},
-                            "summarize_by": {"type": "string", "description": "Summarization type (none, sum, count, min, max, average)"},
-                            "is_hidden": {"type": "boolean", "description": "Hide column (optional)", "default": False}
-                        },
-                        "required": ["project_path", "table_name", "column_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["add_column"]
                 )
             },
             "update_column": {
-                "handler": lambda args: self.operations["column"].execute(OperationType.UPDATE, args),
+                "operation": self.operations["column"],
+                "operation_type": OperationType.UPDATE,
                 "tool": Tool(
                     name="update_column",
                     description="Update an existing column",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table containing the column"},
-                            "column_name": {"type": "string", "description": "Name of the column to update"},
-                            "data_type": {"type": "string", "description": "New data type (optional)"},
-                            "expression": {"type": "string", "description": "New DAX expression for calculated column (optional)"},
-                            "format_string": {"type": "string", "description": "New format string (optional)"},
-                            "summarize_by": {"type": "string", "description": "New summarization type (optional)"},
-                            "is_hidden": {"type": "boolean", "description": "Hide/show column (optional)"}
-                        },
-                        "required": ["project_path", "table_name", "column_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["update_column"]
                 )
             },
             "delete_column": {
-                "handler": lambda args: self.operations["column"].execute(OperationType.DELETE, args),
+                "operation": self.operations["column"],
+                "operation_type": OperationType.DELETE,
                 "tool": Tool(
                     name="delete_column",
                     description="Delete a column from a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table containing the column"},
-                            "column_name": {"type": "string", "description": "Name of the column to delete"}
-                        },
-                        "required": ["project_path", "table_name", "column_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["delete_column"]
                 )
             },
         })
@@ -211,46 +320,30 @@ class SimplifiedPBIPServer:
         # Table tools
         tools.update({
             "list_tables": {
-                "handler": lambda args: self.operations["table"].execute(OperationType.LIST, args),
+                "operation": self.operations["table"],
+                "operation_type": OperationType.LIST,
                 "tool": Tool(
                     name="list_tables",
                     description="List all tables in the project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["list_tables"]
                 )
             },
             "get_table_details": {
-                "handler": lambda args: self.operations["table"].execute(OperationType.GET, args),
+                "operation": self.operations["table"],
+                "operation_type": OperationType.GET,
                 "tool": Tool(
                     name="get_table_details",
                     description="Get detailed information about a table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"},
-                            "table_name": {"type": "string", "description": "Table name"}
-                        },
-                        "required": ["project_path", "table_name"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["get_table_details"]
                 )
             },
             "get_model_details": {
-                "handler": lambda args: self.operations["table"].execute(OperationType.GET_MODEL_DETAILS, args),
+                "operation": self.operations["table"],
+                "operation_type": OperationType.GET_MODEL_DETAILS,
                 "tool": Tool(
                     name="get_model_details",
                     description="Get comprehensive details of the entire semantic model with all tables, columns, measures, and relationships",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["get_model_details"]
                 )
             },
         })
@@ -258,17 +351,12 @@ class SimplifiedPBIPServer:
         # Relationship tools
         tools.update({
             "list_relationships": {
-                "handler": lambda args: self.operations["relationship"].execute(OperationType.LIST, args),
+                "operation": self.operations["relationship"],
+                "operation_type": OperationType.LIST,
                 "tool": Tool(
                     name="list_relationships",
                     description="List all relationships in the project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file or .SemanticModel directory"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["list_relationships"]
                 )
             },
         })
@@ -280,13 +368,7 @@ class SimplifiedPBIPServer:
                 "tool": Tool(
                     name="list_projects",
                     description="List all PBIP projects and standalone semantic models in a directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "directory": {"type": "string", "description": "Directory path to scan for PBIP projects and standalone .SemanticModel directories"}
-                        },
-                        "required": ["directory"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["list_projects"]
                 )
             },
             "load_project": {
@@ -294,13 +376,7 @@ class SimplifiedPBIPServer:
                 "tool": Tool(
                     name="load_project",
                     description="Load complete project structure and metadata from PBIP project or standalone semantic model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_path": {"type": "string", "description": "Path to PBIP project file, directory, or .SemanticModel directory"}
-                        },
-                        "required": ["project_path"]
-                    }
+                    inputSchema=_TOOL_SCHEMAS["load_project"]
                 )
             },
         })
@@ -313,26 +389,31 @@ class SimplifiedPBIPServer:
         @self.app.list_tools()
         async def list_tools():
             """List all available tools."""
-            return [tool_info["tool"] for tool_info in self.tools.values()]
+            return list(self._tool_objects)
         
         @self.app.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls."""
-            if name not in self.tools:
-                return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+            index = self._tool_index.get(name)
+            if index is None:
+                return [TextContent(type="text", text=dumps({"error": f"Unknown tool: {name}"}))]
             
             try:
-                handler = self.tools[name]["handler"]
-                return await handler(arguments)
+                return await self._tool_handlers[index](arguments)
+            except _EXPECTED_ERRORS as e:
+                logger.debug("Invalid request for tool %s: %s", name, e)
+                return self._tool_error_response(name, e)
+            except KeyError as e:
+                # Only a required argument the caller left out is a bad request;
+                # any other KeyError is a bug and keeps its traceback
+                if self._is_missing_argument(index, arguments, e):
+                    logger.debug("Missing argument for tool %s: %s", name, e)
+                else:
+                    logger.error("Error in tool %s: %s", name, e, exc_info=True)
+                return self._tool_error_response(name, e)
             except Exception as e:
-                logger.error(f"Error in tool {name}: {e}", exc_info=True)
-                # Ensure error response is valid JSON
-                error_response = {
-                    "error": str(e),
-                    "tool": name,
-                    "type": type(e).__name__
-                }
-                return [TextContent(type="text", text=json.dumps(error_response, indent=2))]
+                logger.error("Error in tool %s: %s", name, e, exc_info=True)
+                return self._tool_error_response(name, e)
         
         @self.app.list_resources()
         async def list_resources() -> List[Resource]:
@@ -354,67 +435,118 @@ class SimplifiedPBIPServer:
         async def read_resource(uri: str) -> str:
             """Read resource content."""
             if uri == "pbip://help":
-                return self._get_help_text()
+                return self._help_text
             elif uri == "pbip://tmdl/syntax":
-                return self._get_tmdl_syntax_guide()
+                return self._tmdl_guide
             return f"Unknown resource: {uri}"
     
+    def _is_missing_argument(self, index: int, arguments: Dict[str, Any], error: KeyError) -> bool:
+        """Check whether a KeyError names a declared tool argument absent from the call."""
+        if len(error.args) != 1:
+            return False
+        key = error.args[0]
+        properties = self._tool_objects[index].inputSchema.get("properties", {})
+        return isinstance(key, str) and key in properties and key not in arguments
+    
+    def _tool_error_response(self, name: str, error: Exception) -> List[TextContent]:
+        """Wrap an exception raised by a tool in a JSON error response."""
+        error_response = {
+            "error": str(error),
+            "tool": name,
+            "type": type(error).__name__
+        }
+        return [TextContent(type="text", text=dumps(error_response))]
+    
     async def _list_projects(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """List PBIP projects and standalone semantic models in a directory."""
-        import json
-        from pathlib import Path
-        
         directory = Path(arguments["directory"])
         if not directory.exists():
             return [TextContent(type="text", text=f"Directory not found: {directory}")]
         
+        # Walk off the event loop so concurrent tool calls stay responsive
+        projects = await asyncio.to_thread(self._scan_projects, directory)
+        
+        return [TextContent(type="text", text=dumps({
+            "count": len(projects),
+            "projects": projects
+        }))]
+    
+    def _scan_projects(self, directory: Path) -> List[Dict[str, Any]]:
+        """Find .pbip projects and standalone .SemanticModel directories in one walk.
+        
+        Each directory is listed once; that listing classifies its entries and
+        supplies the has_semantic_model/has_report flags for any .pbip inside it.
+        The walk works on plain strings and only builds Path objects for matches.
+        """
         projects = []
+        semantic_dirs = []
         processed_dirs = set()
         
-        # Find .pbip projects
-        for pbip_file in directory.rglob("*.pbip"):
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
             try:
-                project_info = {
-                    "name": pbip_file.stem,
-                    "path": str(pbip_file),
-                    "directory": str(pbip_file.parent),
-                    "type": "pbip_project",
-                    "has_semantic_model": any(pbip_file.parent.glob("*.SemanticModel")),
-                    "has_report": any(pbip_file.parent.glob("*.Report"))
-                }
-                projects.append(project_info)
-                processed_dirs.add(pbip_file.parent)
-            except Exception as e:
-                logger.warning(f"Error scanning project {pbip_file}: {e}")
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning("Error scanning directory %s: %s", current, e)
+                continue
+            
+            pbip_paths = []
+            subdirs = []
+            has_semantic_model = False
+            has_report = False
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".pbip"):
+                    pbip_paths.append(entry.path)
+                elif name.endswith(".SemanticModel"):
+                    has_semantic_model = True
+                    semantic_dirs.append((current, entry.path))
+                elif name.endswith(".Report"):
+                    has_report = True
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    pass
+            
+            if pbip_paths:
+                processed_dirs.add(current)
+                parent = str(Path(current))
+                for pbip_path in pbip_paths:
+                    pbip_file = Path(pbip_path)
+                    projects.append({
+                        "name": pbip_file.stem,
+                        "path": str(pbip_file),
+                        "directory": parent,
+                        "type": "pbip_project",
+                        "has_semantic_model": has_semantic_model,
+                        "has_report": has_report
+                    })
+            
+            # Depth-first, in listing order
+            subdirs.reverse()
+            stack.extend(subdirs)
         
-        # Find standalone .SemanticModel directories
-        for semantic_dir in directory.rglob("*.SemanticModel"):
-            try:
-                # Skip if this semantic model is already part of a .pbip project
-                if semantic_dir.parent in processed_dirs:
-                    continue
-                    
-                project_info = {
-                    "name": semantic_dir.name.replace('.SemanticModel', ''),
-                    "path": str(semantic_dir),
-                    "directory": str(semantic_dir.parent),
-                    "type": "standalone_semantic_model",
-                    "has_semantic_model": True,
-                    "has_report": False
-                }
-                projects.append(project_info)
-            except Exception as e:
-                logger.warning(f"Error scanning semantic model {semantic_dir}: {e}")
+        for parent, semantic_path in semantic_dirs:
+            # Skip if this semantic model is already part of a .pbip project
+            if parent in processed_dirs:
+                continue
+            semantic_dir = Path(semantic_path)
+            projects.append({
+                "name": semantic_dir.name.replace('.SemanticModel', ''),
+                "path": str(semantic_dir),
+                "directory": str(semantic_dir.parent),
+                "type": "standalone_semantic_model",
+                "has_semantic_model": True,
+                "has_report": False
+            })
         
-        return [TextContent(type="text", text=json.dumps({
-            "count": len(projects),
-            "projects": projects
-        }, indent=2))]
+        return projects
     
     async def _load_project(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Load complete project structure."""
-        import json
-        
         try:
             project = self.project_parser.load_project(arguments["project_path"])
             
@@ -428,21 +560,26 @@ class SimplifiedPBIPServer:
             }
             
             if project.semantic_model:
+                total_measures = total_columns = 0
+                for table in project.semantic_model.tables:
+                    total_measures += len(table.measures)
+                    total_columns += len(table.columns)
+                
                 result["semantic_model"] = {
                     "name": project.semantic_model.name,
                     "culture": project.semantic_model.culture,
                     "table_count": len(project.semantic_model.tables),
                     "relationship_count": len(project.semantic_model.relationships),
-                    "total_measures": sum(len(t.measures) for t in project.semantic_model.tables),
-                    "total_columns": sum(len(t.columns) for t in project.semantic_model.tables),
+                    "total_measures": total_measures,
+                    "total_columns": total_columns,
                 }
             
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [TextContent(type="text", text=dumps(result))]
         except Exception as e:
             return [TextContent(type="text", text=f"Error loading project: {str(e)}")]
     
-    def _get_help_text(self) -> str:
-        """Get help text for the server."""
+    def _build_help_text(self) -> str:
+        """Build help text for the server."""
         tool_categories = {
             "Project Management": ["list_projects", "load_project"],
             "Table Operations": ["list_tables", "get_table_details"],
@@ -451,7 +588,7 @@ class SimplifiedPBIPServer:
             "Relationship Operations": ["list_relationships"],
         }
         
-        help_text = """# PBIP MCP Server Help
+        parts = ["""# PBIP MCP Server Help
 
 A simplified and extensible MCP server for Power BI Desktop Project (.pbip) files.
 
@@ -463,29 +600,33 @@ A simplified and extensible MCP server for Power BI Desktop Project (.pbip) file
 
 ## Available Tools by Category:
 
-"""
+"""]
         
         for category, tool_names in tool_categories.items():
-            help_text += f"### {category}\n"
+            parts.append(f"### {category}\n")
             for tool_name in tool_names:
-                if tool_name in self.tools:
-                    tool = self.tools[tool_name]["tool"]
-                    help_text += f"- **{tool_name}**: {tool.description}\n"
-            help_text += "\n"
+                tool_info = self.tools.get(tool_name)
+                if tool_info is not None:
+                    parts.append(f"- **{tool_name}**: {tool_info['tool'].description}\n")
+            parts.append("\n")
         
-        help_text += """## Extending the Server:
+        parts.append("""## Extending the Server:
 
 To add new operations:
 
 1. Create a new operation class inheriting from `BaseOperation`
-2. Implement the `execute` method with your operation logic
+2. Implement `_build_handlers` to map operation types to async handler methods
+   (overriding `execute(operation, arguments)` directly is still supported)
 3. Register the operation handler with the server
 4. Add corresponding tools to the tool registry
 
 Example:
 ```python
 class MyCustomOperations(BaseOperation):
-    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        return {OperationType.LIST: self.list_items}
+
+    async def list_items(self, arguments: Dict[str, Any]) -> List[TextContent]:
         # Your custom logic here
         pass
 
@@ -496,9 +637,9 @@ server.register_operation_handler("custom", MyCustomOperations)
 ## Error Handling:
 All errors are returned in a consistent format with descriptive messages.
 The server validates inputs and provides helpful error messages when operations fail.
-"""
+""")
         
-        return help_text
+        return "".join(parts)
     
     def _get_tmdl_syntax_guide(self) -> str:
         """Get TMDL syntax guide."""
@@ -607,6 +748,10 @@ relationship rel_Sales_Product
         
         logger.info("Starting Simplified PBIP MCP Server")
         
+        if sys.version_info >= (3, 12):
+            # Tool handlers that finish without suspending skip a loop round-trip
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await self.app.run(
                 read_stream, write_stream, self.app.create_initialization_options()
@@ -616,7 +761,13 @@ relationship rel_Sales_Product
 def main():
     """Main entry point."""
     server = SimplifiedPBIPServer()
-    asyncio.run(server.run_stdio())
+    try:
+        # Optional libuv-based event loop (not available on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run_stdio())
+    else:
+        uvloop.run(server.run_stdio())
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 """TMDL writers module."""
 
-from .tmdl_writer import TMDLWriter
+from .tmdl_writer import TMDLWriter, get_tmdl_writer
 
-__all__ = ["TMDLWriter"]
\ No newline at end of file
+__all__ = ["TMDLWriter", "get_tmdl_writer"]
\ No newline at end of file
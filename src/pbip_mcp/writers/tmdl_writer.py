@@ -1,8 +1,57 @@
 """TMDL file writer with support for various operations."""
 
+import os
 import re
+import textwrap
+from functools import cache
 from typing import Any, Dict, List, Optional
-import uuid
+
+
+# Element definition patterns, matched against the stripped line
+_ELEMENT_PATTERNS = {
+    "measure": re.compile(r"measure\s+(.+?)\s*="),
+    "column": re.compile(r"column\s+(.+?)(\s*=|$)"),
+    "table": re.compile(r"table\s+(.+?)$"),
+}
+
+# Element names containing any of these characters, or equal to a reserved word, are quoted
+_NAME_SPECIAL_CHARS = frozenset(" .-+*/()[]{}@#$%^&")
+_RESERVED_WORDS = frozenset(("table", "column", "measure", "partition", "relationship"))
+
+# Snake-case update keys and their TMDL property names
+_PROPERTY_MAP = {
+    "format_string": "formatString",
+    "data_type": "dataType",
+    "summarize_by": "summarizeBy",
+    "is_hidden": "isHidden",
+    "lineage_tag": "lineageTag",
+    "source_column": "sourceColumn",
+}
+
+# Boolean properties written as a bare flag when true
+_BOOL_FLAG_PROPS = frozenset(("isHidden", "isPrivate"))
+
+# Update keys that are not written as element properties
+_NON_PROPERTY_KEYS = frozenset(("expression", "name"))
+
+# Tab indent strings for the nesting depths TMDL files actually use
+_INDENTS = tuple("\t" * depth for depth in range(16))
+
+
+def _indent_string(depth: int) -> str:
+    """Return the tab indent for a nesting depth."""
+    if 0 <= depth < len(_INDENTS):
+        return _INDENTS[depth]
+    return "\t" * depth
+
+
+def _new_lineage_tag() -> str:
+    """Return a random (version 4) UUID string without building a uuid.UUID."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class TMDLWriter:
@@ -18,21 +67,16 @@ class TMDLWriter:
         
         # Insert the new element
         indent_level = parent_context.get("indent_level", 1) if parent_context else 1
-        indent = "\t" * indent_level
+        indent = _indent_string(indent_level)
         
         # Split element definition into lines and add proper indentation
-        element_lines = element_def.strip().split("\n")
-        for i, line in enumerate(element_lines):
-            if i == 0:
-                lines.insert(insert_position + i, f"{indent}{line}")
-            else:
-                # Sub-properties get additional indentation
-                lines.insert(insert_position + i, f"{indent}{line}")
+        new_lines = [f"{indent}{line}" for line in element_def.strip().split("\n")]
         
-        # Add empty line after element if needed
-        if insert_position + len(element_lines) < len(lines):
-            if lines[insert_position + len(element_lines)].strip():
-                lines.insert(insert_position + len(element_lines), "")
+        # Add empty line after element if the following line has content
+        if insert_position < len(lines) and lines[insert_position].strip():
+            new_lines.append("")
+        
+        lines[insert_position:insert_position] = new_lines
         
         return "\n".join(lines)
     
@@ -45,6 +89,12 @@ class TMDLWriter:
         element_indent = 0
         properties_updated = set()
         
+        # TMDL property name -> (update key, value); the first update wins on collisions
+        tmdl_updates = {}
+        for prop, value in updates.items():
+            if prop != "expression":
+                tmdl_updates.setdefault(self._to_tmdl_property_name(prop), (prop, value))
+        
         i = 0
         while i < len(lines):
             line = lines[i]
@@ -52,6 +102,7 @@ class TMDLWriter:
             if self._is_element_definition(line, element_type, element_name):
                 in_element = True
                 element_indent = self._get_indentation(line)
+                property_indent = _indent_string(element_indent + 1)
                 
                 # Handle expression updates for measures and calculated columns
                 if element_type in ["measure", "column"] and "expression" in updates:
@@ -64,10 +115,10 @@ class TMDLWriter:
                 continue
             
             if in_element:
-                line_indent = self._get_indentation(line)
+                stripped = line.lstrip()
                 
                 # Check if we've exited the element
-                if line.strip() and line_indent <= element_indent:
+                if stripped and self._get_indentation(line) <= element_indent:
                     in_element = False
                     # Add any new properties before exiting
                     self._add_new_properties(updated_lines, element_indent + 1, updates, properties_updated)
@@ -76,20 +127,13 @@ class TMDLWriter:
                     continue
                 
                 # Update existing properties
-                property_updated = False
-                for prop, value in updates.items():
-                    if prop == "expression":
-                        continue  # Already handled
-                    
-                    tmdl_prop = self._to_tmdl_property_name(prop)
-                    if line.strip().startswith(f"{tmdl_prop}:"):
-                        indent = '\t' * (element_indent + 1)
-                        updated_lines.append(f"{indent}{tmdl_prop}: {self._format_value(value)}")
-                        properties_updated.add(prop)
-                        property_updated = True
-                        break
-                
-                if not property_updated:
+                colon = stripped.find(":")
+                hit = tmdl_updates.get(stripped[:colon]) if colon > 0 else None
+                if hit is not None:
+                    prop, value = hit
+                    updated_lines.append(f"{property_indent}{stripped[:colon]}: {self._format_value(value)}")
+                    properties_updated.add(prop)
+                else:
                     updated_lines.append(line)
             else:
                 updated_lines.append(line)
@@ -105,87 +149,72 @@ class TMDLWriter:
     def delete_element(self, content: str, element_type: str, element_name: str) -> str:
         """Delete an element from TMDL content."""
         lines = content.split("\n")
+        definitions = [i for i, line in enumerate(lines)
+                       if self._is_element_definition(line, element_type, element_name)]
+        if not definitions:
+            return content
+        
         filtered_lines = []
-        in_element = False
-        element_indent = 0
-        skip_empty_after = False
-        
-        # Also track if we need to remove description comments
-        removing_description = False
-        description_indent = 0
-        
-        for i, line in enumerate(lines):
-            # Check for description comments before element
-            if not in_element and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                if self._is_element_definition(next_line, element_type, element_name):
-                    if line.strip().startswith("///"):
-                        removing_description = True
-                        description_indent = self._get_indentation(line)
-                        continue
-            
-            # Continue removing description lines
-            if removing_description:
-                if line.strip().startswith("///") and self._get_indentation(line) == description_indent:
-                    continue
-                else:
-                    removing_description = False
+        keep_from = 0  # First line not yet copied to the output
+        comment_from = 0  # The line closing a deleted block is always kept
+        total = len(lines)
+        next_def = 0
+        
+        while next_def < len(definitions):
+            start = definitions[next_def]
+            next_def += 1
             
-            if self._is_element_definition(line, element_type, element_name):
-                in_element = True
-                element_indent = self._get_indentation(line)
-                skip_empty_after = True
-                continue
-            
-            if in_element:
-                line_indent = self._get_indentation(line)
-                if line.strip() and line_indent <= element_indent:
-                    in_element = False
-                else:
-                    continue
+            # Drop the description comment directly above the element
+            if start - 1 >= comment_from and lines[start - 1].strip().startswith("///"):
+                filtered_lines.extend(lines[keep_from:start - 1])
+            else:
+                filtered_lines.extend(lines[keep_from:start])
             
-            # Skip empty line immediately after deleted element
-            if skip_empty_after and not line.strip():
-                skip_empty_after = False
-                continue
+            # The element runs until a non-empty line at or above its indentation;
+            # a further definition inside it starts a new block
+            element_indent = self._get_indentation(lines[start])
+            end = start + 1
+            while end < total:
+                if next_def < len(definitions) and definitions[next_def] == end:
+                    element_indent = self._get_indentation(lines[end])
+                    next_def += 1
+                elif lines[end].strip() and self._get_indentation(lines[end]) <= element_indent:
+                    break
+                end += 1
             
-            skip_empty_after = False
-            filtered_lines.append(line)
+            keep_from = end
+            comment_from = end + 1
         
+        filtered_lines.extend(lines[keep_from:])
         return "\n".join(filtered_lines)
     
     def add_description_comments(self, content: str, element_type: str, element_name: str, 
                                description: str) -> str:
         """Add or update description comments for an element."""
         lines = content.split("\n")
-        updated_lines = []
+        targets = [i for i, line in enumerate(lines)
+                   if self._is_element_definition(line, element_type, element_name)]
+        if not targets:
+            return content
         
         # Split description into comment lines
         description_lines = self._split_description_for_comments(description)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            
-            # Check if this is our target element
-            if self._is_element_definition(line, element_type, element_name):
-                element_indent = self._get_indentation(line)
-                indent_str = "\t" * element_indent
-                
-                # Remove any existing description comments immediately before
-                while updated_lines and updated_lines[-1].strip().startswith("///"):
-                    updated_lines.pop()
-                
-                # Add new description comments
-                for desc_line in description_lines:
-                    updated_lines.append(f"{indent_str}/// {desc_line}")
-                
-                updated_lines.append(line)
-            else:
-                updated_lines.append(line)
+        updated_lines = []
+        keep_from = 0
+        for target in targets:
+            # Replace any existing description comments immediately before
+            start = target
+            while start > keep_from and lines[start - 1].strip().startswith("///"):
+                start -= 1
+            updated_lines.extend(lines[keep_from:start])
             
-            i += 1
+            indent_str = _indent_string(self._get_indentation(lines[target]))
+            updated_lines.extend(f"{indent_str}/// {desc_line}" for desc_line in description_lines)
+            updated_lines.append(lines[target])
+            keep_from = target + 1
         
+        updated_lines.extend(lines[keep_from:])
         return "\n".join(updated_lines)
     
     def format_measure_definition(self, name: str, expression: str, 
@@ -194,7 +223,13 @@ class TMDLWriter:
                                 lineage_tag: Optional[str] = None) -> str:
         """Format a complete measure definition."""
         if not lineage_tag:
-            lineage_tag = str(uuid.uuid4())
+            lineage_tag = _new_lineage_tag()
+        
+        formatted_name = self._format_element_name(name)
+        
+        # Common case: bare measure with no description or format string
+        if not description and not format_string:
+            return f"measure {formatted_name} = {expression}\n\tlineageTag: {lineage_tag}"
         
         lines = []
         
@@ -204,7 +239,6 @@ class TMDLWriter:
                 lines.append(f"/// {desc_line}")
         
         # Add measure definition
-        formatted_name = self._format_element_name(name)
         lines.append(f"measure {formatted_name} = {expression}")
         lines.append(f"\tlineageTag: {lineage_tag}")
         
@@ -222,16 +256,20 @@ class TMDLWriter:
                                lineage_tag: Optional[str] = None) -> str:
         """Format a complete column definition."""
         if not lineage_tag:
-            lineage_tag = str(uuid.uuid4())
-        
-        lines = []
+            lineage_tag = _new_lineage_tag()
         
-        # Add column definition
+        # Column definition line
         formatted_name = self._format_element_name(name)
         if expression:
-            lines.append(f"column {formatted_name} = {expression}")
+            header = f"column {formatted_name} = {expression}"
         else:
-            lines.append(f"column {formatted_name}")
+            header = f"column {formatted_name}"
+        
+        # Common case: only the required properties
+        if not format_string and not summarize_by and not is_hidden:
+            return f"{header}\n\tdataType: {data_type}\n\tlineageTag: {lineage_tag}"
+        
+        lines = [header]
         
         # Add required properties
         lines.append(f"\tdataType: {data_type}")
@@ -252,29 +290,26 @@ class TMDLWriter:
     def _find_insertion_point(self, lines: list, element_type: str, 
                             context: Dict[str, Any] = None) -> int:
         """Find the appropriate insertion point for a new element."""
-        last_similar_element = -1
+        prefix = f"{element_type} "
         
-        for i, line in enumerate(lines):
-            if line.strip().startswith(f"{element_type} "):
-                last_similar_element = i
-                # Find end of this element block
+        # Only the last similar element matters: scan backwards for it, then
+        # forward to the end of its block
+        for i in range(len(lines) - 1, -1, -1):
+            if lines[i].strip().startswith(prefix):
+                element_indent = self._get_indentation(lines[i])
                 j = i + 1
-                element_indent = self._get_indentation(line)
                 while j < len(lines):
                     if lines[j].strip() and self._get_indentation(lines[j]) <= element_indent:
                         break
                     j += 1
-                last_similar_element = j - 1
-        
-        if last_similar_element >= 0:
-            # Insert after the last similar element
-            return last_similar_element + 1
+                # Insert after the last similar element
+                return j
         
         # Default positions based on element type
         if element_type == "measure":
             # Insert after table definition but before columns
             for i, line in enumerate(lines):
-                if line.strip().startswith("column ") or line.strip().startswith("partition "):
+                if line.strip().startswith(("column ", "partition ")):
                     return i
         elif element_type == "column":
             # Insert after last column but before partitions
@@ -287,30 +322,29 @@ class TMDLWriter:
     
     def _is_element_definition(self, line: str, element_type: str, element_name: str) -> bool:
         """Check if a line defines the specified element."""
-        if not line.strip().startswith(f"{element_type} "):
+        # Substring test rejects most lines without allocating a stripped copy
+        if element_type not in line:
+            return False
+        
+        stripped = line.strip()
+        if not stripped.startswith(f"{element_type} "):
             return False
         
         # Extract element name from line
-        if element_type == "measure":
-            match = re.match(r"measure\s+(.+?)\s*=", line.strip())
-            if match:
-                found_name = match.group(1).strip().strip("'\"")
-                return found_name == element_name.strip("'\"")
-        elif element_type == "column":
-            match = re.match(r"column\s+(.+?)(\s*=|$)", line.strip())
-            if match:
-                found_name = match.group(1).strip().strip("'\"")
-                return found_name == element_name.strip("'\"")
-        elif element_type == "table":
-            match = re.match(r"table\s+(.+?)$", line.strip())
-            if match:
-                found_name = match.group(1).strip().strip("'\"")
-                return found_name == element_name.strip("'\"")
+        pattern = _ELEMENT_PATTERNS.get(element_type)
+        if pattern is None:
+            return False
+        
+        match = pattern.match(stripped)
+        if match:
+            found_name = match.group(1).strip().strip("'\"")
+            return found_name == element_name.strip("'\"")
         
         return False
     
     def _get_indentation(self, line: str) -> int:
         """Get indentation level of a line."""
+        # C-level lstrip beats a Python loop over the leading tabs
         return len(line) - len(line.lstrip("\t"))
     
     def _update_expression_line(self, line: str, new_expression: str) -> str:
@@ -324,8 +358,7 @@ class TMDLWriter:
         """Format a value for TMDL."""
         if isinstance(value, str):
             # Don't double-quote if already quoted
-            if (value.startswith('"') and value.endswith('"')) or \
-               (value.startswith("'") and value.endswith("'")):
+            if value and value[0] == value[-1] and value[0] in "'\"":
                 return value
             return f'"{value}"'
         elif isinstance(value, bool):
@@ -336,47 +369,29 @@ class TMDLWriter:
     def _format_element_name(self, name: str) -> str:
         """Format element name, adding quotes if needed."""
         # If already quoted, return as-is
-        if (name.startswith("'") and name.endswith("'")) or \
-           (name.startswith('"') and name.endswith('"')):
+        if name and name[0] == name[-1] and name[0] in "'\"":
             return name
         
-        # Check if name needs quotes
-        needs_quotes = False
-        if " " in name or any(char in name for char in ".-+*/()[]{}@#$%^&"):
-            needs_quotes = True
-        
-        # Also check if name is a reserved word
-        reserved_words = ["table", "column", "measure", "partition", "relationship"]
-        if name.lower() in reserved_words:
-            needs_quotes = True
+        # Quote names with special characters or that are reserved words
+        needs_quotes = not _NAME_SPECIAL_CHARS.isdisjoint(name) or name.lower() in _RESERVED_WORDS
         
         return f"'{name}'" if needs_quotes else name
     
     def _to_tmdl_property_name(self, property_name: str) -> str:
         """Convert property name to TMDL format."""
-        # Map common property names
-        property_map = {
-            "format_string": "formatString",
-            "data_type": "dataType",
-            "summarize_by": "summarizeBy",
-            "is_hidden": "isHidden",
-            "lineage_tag": "lineageTag",
-            "source_column": "sourceColumn",
-        }
-        
-        return property_map.get(property_name, property_name)
+        return _PROPERTY_MAP.get(property_name, property_name)
     
     def _add_new_properties(self, lines: list, indent_level: int, 
                           properties: Dict[str, Any], existing_properties: set):
         """Add new properties that don't exist yet."""
-        indent = "\t" * indent_level
+        indent = _indent_string(indent_level)
         
         for prop, value in properties.items():
-            if prop not in existing_properties and prop not in ["expression", "name"]:
+            if prop not in existing_properties and prop not in _NON_PROPERTY_KEYS:
                 tmdl_prop = self._to_tmdl_property_name(prop)
                 
                 # Handle boolean flags
-                if isinstance(value, bool) and value and tmdl_prop in ["isHidden", "isPrivate"]:
+                if isinstance(value, bool) and value and tmdl_prop in _BOOL_FLAG_PROPS:
                     lines.append(f"{indent}{tmdl_prop}")
                 else:
                     lines.append(f"{indent}{tmdl_prop}: {self._format_value(value)}")
@@ -386,8 +401,6 @@ class TMDLWriter:
         if not description:
             return []
         
-        import textwrap
-        
         # First split by sentences to keep logical breaks
         sentences = description.replace(". ", ".\n").split("\n")
         lines = []
@@ -398,12 +411,17 @@ class TMDLWriter:
                 continue
             
             # Wrap long sentences
-            wrapped = textwrap.fill(
+            lines.extend(textwrap.wrap(
                 sentence, 
                 width=80, 
                 break_long_words=False, 
                 break_on_hyphens=False
-            )
-            lines.extend(wrapped.split("\n"))
+            ))
         
-        return [line.strip() for line in lines if line.strip()]
\ No newline at end of file
+        return [line.strip() for line in lines if line.strip()]
+
+
+@cache
+def get_tmdl_writer() -> TMDLWriter:
+    """Return the process-wide shared TMDLWriter."""
+    return TMDLWriter()
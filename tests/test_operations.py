@@ -0,0 +1,102 @@
+"""Tests for BaseOperation dispatch and read-response caching."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from mcp.types import TextContent
+
+from pbip_mcp.operations import BaseOperation, MeasureOperations, OperationHandler, OperationType
+
+TEST_REPORT = Path(__file__).resolve().parent.parent / "TestReport"
+
+
+class ExecuteOnlyOperations(BaseOperation):
+    async def execute(self, operation: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        return self._success_response({"operation": operation})
+
+
+class HandlerTableOperations(BaseOperation):
+    def _build_handlers(self) -> Dict[str, OperationHandler]:
+        return {OperationType.LIST: self.list_items}
+
+    async def list_items(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        return self._success_response({"items": []})
+
+
+async def test_execute_only_subclass_still_dispatches():
+    operations = ExecuteOnlyOperations()
+
+    result = await operations.get_handler(OperationType.LIST)({})
+
+    assert json.loads(result[0].text) == {"operation": OperationType.LIST}
+
+
+async def test_handler_table_subclass_dispatches_and_rejects_unknown():
+    operations = HandlerTableOperations()
+
+    listed = await operations.execute(OperationType.LIST, {})
+    unknown = await operations.execute(OperationType.DELETE, {})
+
+    assert json.loads(listed[0].text) == {"items": []}
+    assert json.loads(unknown[0].text)["error"] == "Unknown operation: delete"
+
+
+def test_subclass_without_handlers_or_execute_is_rejected():
+    class EmptyOperations(BaseOperation):
+        pass
+
+    with pytest.raises(TypeError, match="_build_handlers"):
+        EmptyOperations()
+
+
+def _copy_project(tmp_path, name):
+    shutil.copytree(TEST_REPORT, tmp_path / name)
+    return str(tmp_path / name)
+
+
+async def _fact_measures(operations, project_path):
+    result = await operations.execute(
+        OperationType.LIST, {"project_path": project_path, "table_name": "Fact"}
+    )
+    return {m["name"]: m["expression"] for m in json.loads(result[0].text)["measures"]}
+
+
+async def test_cached_reads_see_add_update_and_delete(tmp_path):
+    project_path = _copy_project(tmp_path, "TestReport")
+    operations = MeasureOperations()
+    args = {"project_path": project_path, "table_name": "Fact", "measure_name": "Cached"}
+
+    assert "Cached" not in await _fact_measures(operations, project_path)
+
+    await operations.execute(OperationType.ADD, {**args, "expression": "1"})
+    assert (await _fact_measures(operations, project_path))["Cached"] == "1"
+
+    await operations.execute(OperationType.UPDATE, {**args, "expression": "2"})
+    assert (await _fact_measures(operations, project_path))["Cached"] == "2"
+
+    await operations.execute(OperationType.DELETE, args)
+    assert "Cached" not in await _fact_measures(operations, project_path)
+
+
+async def test_write_to_one_project_does_not_stale_another(tmp_path):
+    project_a = _copy_project(tmp_path, "A")
+    project_b = _copy_project(tmp_path, "B")
+    operations = MeasureOperations()
+    before_b = await _fact_measures(operations, project_b)
+    await _fact_measures(operations, project_a)
+
+    await operations.execute(OperationType.ADD, {
+        "project_path": project_a, "table_name": "Fact", "measure_name": "OnlyA", "expression": "1",
+    })
+    fact_b = Path(project_b) / "TestCalcGroups.SemanticModel" / "definition" / "tables" / "Fact.tmdl"
+    with open(fact_b, "a", encoding="utf-8") as f:
+        f.write("\n\tmeasure OnlyB = 2\n\t\tlineageTag: only-b\n")
+
+    after_a = await _fact_measures(operations, project_a)
+    after_b = await _fact_measures(operations, project_b)
+
+    assert "OnlyA" in after_a and "OnlyB" not in after_a
+    assert after_b == {**before_b, "OnlyB": "2"}
@@ -0,0 +1,69 @@
+"""Tests for cache invalidation after the server writes a table file."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pbip_mcp.operations import MeasureOperations
+from pbip_mcp.operations.base import OperationType
+from pbip_mcp.parsers import tmdl_parser
+
+TEST_REPORT = Path(__file__).resolve().parent.parent / "TestReport"
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    """Copy the sample project so tests can edit it."""
+    shutil.copytree(TEST_REPORT, tmp_path / "TestReport")
+    return str(tmp_path / "TestReport")
+
+
+async def _measure_expression(operations, project_path, name):
+    result = await operations.execute(
+        OperationType.LIST, {"project_path": project_path, "table_name": "Fact"}
+    )
+    data = json.loads(result[0].text)
+    return next(m["expression"] for m in data["measures"] if m["name"] == name)
+
+
+async def test_update_visible_when_mtime_and_size_unchanged(project_path):
+    """A same-size rewrite within one mtime tick must not serve the old parse."""
+    operations = MeasureOperations()
+    args = {"project_path": project_path, "table_name": "Fact", "measure_name": "Z"}
+    table_file = Path(project_path) / "TestCalcGroups.SemanticModel" / "definition" / "tables" / "Fact.tmdl"
+
+    await operations.execute(OperationType.ADD, {**args, "expression": "1"})
+    assert await _measure_expression(operations, project_path, "Z") == "1"
+    before = os.stat(table_file)
+
+    await operations.execute(OperationType.UPDATE, {**args, "expression": "2"})
+    os.utime(table_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert os.stat(table_file).st_size == before.st_size
+    assert "measure Z = 2" in table_file.read_text(encoding="utf-8")
+
+    assert await _measure_expression(operations, project_path, "Z") == "2"
+
+
+def test_parse_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(tmdl_parser, "_PARSE_CACHE_SIZE", 3)
+    monkeypatch.setattr(tmdl_parser, "_parse_cache", tmdl_parser.OrderedDict())
+    files = []
+    for i in range(5):
+        f = tmp_path / f"T{i}.tmdl"
+        f.write_text(f"table T{i}\n\tlineageTag: t{i}\n", encoding="utf-8")
+        files.append(f)
+
+    for f in files:
+        tmdl_parser.parse_tmdl_file(f)
+    tmdl_parser.parse_tmdl_file(files[2])  # most recently used survives the next insert
+    extra = tmp_path / "Extra.tmdl"
+    extra.write_text("table Extra\n\tlineageTag: e\n", encoding="utf-8")
+    tmdl_parser.parse_tmdl_file(extra)
+
+    assert list(tmdl_parser._parse_cache) == [str(files[4]), str(files[2]), str(extra)]
+
+    tmdl_parser.invalidate_tmdl_file(files[2])
+    assert str(files[2]) not in tmdl_parser._parse_cache
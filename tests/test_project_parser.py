@@ -0,0 +1,52 @@
+"""Tests for ProjectParser's change detection and project cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+from pbip_mcp.parsers.project_parser import ProjectParser, _tree_stamp
+
+TEST_REPORT = Path(__file__).resolve().parent.parent / "TestReport"
+
+
+def test_tree_stamp_skips_only_unreadable_entries(tmp_path):
+    """A dangling symlink must not hide the files listed after it."""
+    for i in range(30):
+        (tmp_path / f"file{i:02d}.tmdl").write_text("x", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.tmdl").write_text("x", encoding="utf-8")
+    os.symlink(tmp_path / "missing", tmp_path / "dangling")
+
+    stamped = {os.path.basename(path) for path, _, _ in _tree_stamp(str(tmp_path))}
+
+    assert stamped == {f"file{i:02d}.tmdl" for i in range(30)} | {"nested.tmdl"}
+
+
+def test_tree_stamp_changes_when_any_file_changes(tmp_path):
+    os.symlink(tmp_path / "missing", tmp_path / "dangling")
+    files = [tmp_path / f"file{i:02d}.tmdl" for i in range(30)]
+    for f in files:
+        f.write_text("x", encoding="utf-8")
+    before = _tree_stamp(str(tmp_path))
+
+    for f in files:
+        f.write_text("longer", encoding="utf-8")
+
+    assert _tree_stamp(str(tmp_path)) != before
+
+
+def test_invalidate_only_evicts_the_written_project(tmp_path):
+    project_a = tmp_path / "A"
+    project_b = tmp_path / "B"
+    shutil.copytree(TEST_REPORT, project_a)
+    shutil.copytree(TEST_REPORT, project_b)
+    parser = ProjectParser()
+    a_dir = parser.load_project(str(project_a))
+    a_pbip = parser.load_project(str(project_a / "TestCalcGroups.pbip"))
+    b_dir = parser.load_project(str(project_b))
+
+    parser.invalidate(str(project_a / "TestCalcGroups.SemanticModel" / "definition" / "tables" / "Fact.tmdl"))
+
+    assert parser.load_project(str(project_b)) is b_dir
+    assert parser.load_project(str(project_a)) is not a_dir
+    assert parser.load_project(str(project_a / "TestCalcGroups.pbip")) is not a_pbip
@@ -0,0 +1,58 @@
+"""Tests for how the server reports tool errors."""
+
+import json
+import logging
+import shutil
+from pathlib import Path
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from pbip_mcp.parsers import ProjectParser
+from pbip_mcp.server import SimplifiedPBIPServer
+
+TEST_REPORT = Path(__file__).resolve().parent.parent / "TestReport"
+
+
+async def _call(server, name, arguments):
+    handler = server.app.request_handlers[CallToolRequest]
+    request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+    result = await handler(request)
+    return json.loads(result.root.content[0].text)
+
+
+async def test_missing_project_is_logged_without_traceback(caplog):
+    server = SimplifiedPBIPServer()
+
+    with caplog.at_level(logging.DEBUG, logger="pbip_mcp.server"):
+        data = await _call(server, "list_tables", {"project_path": "/nonexistent"})
+
+    assert data["type"] == "ProjectNotFoundError"
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+async def test_missing_argument_is_logged_without_traceback(caplog):
+    server = SimplifiedPBIPServer()
+
+    with caplog.at_level(logging.DEBUG, logger="pbip_mcp.server"):
+        data = await _call(server, "list_tables", {})
+
+    assert data["type"] == "KeyError"
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+async def test_parser_bug_keeps_its_traceback(tmp_path, caplog, monkeypatch):
+    shutil.copytree(TEST_REPORT, tmp_path / "TestReport")
+
+    def broken(self, tmdl_file):
+        raise AttributeError("parser bug")
+
+    monkeypatch.setattr(ProjectParser, "_parse_tmdl_file", broken)
+    server = SimplifiedPBIPServer()
+
+    with caplog.at_level(logging.DEBUG, logger="pbip_mcp.server"):
+        data = await _call(server, "list_tables", {"project_path": str(tmp_path / "TestReport")})
+
+    assert data["type"] == "ProjectParseError"
+    errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+    assert errors and errors[0].exc_info is not None
+    assert isinstance(errors[0].exc_info[1].__cause__, AttributeError)
@@ -0,0 +1,99 @@
+"""End-to-end tests for the stdio transport, on asyncio and (when installed) uvloop."""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+TEST_REPORT = ROOT / "TestReport"
+
+# Plain asyncio.run, bypassing main()'s uvloop selection
+ASYNCIO_ENTRY = [
+    "-c",
+    "import asyncio\n"
+    "from pbip_mcp.server import SimplifiedPBIPServer\n"
+    "asyncio.run(SimplifiedPBIPServer().run_stdio())",
+]
+# main() picks uvloop when it is importable
+UVLOOP_ENTRY = ["-m", "pbip_mcp.server"]
+
+
+def _message(msg_id, method, params=None):
+    message = {"jsonrpc": "2.0", "method": method}
+    if msg_id is not None:
+        message["id"] = msg_id
+    if params is not None:
+        message["params"] = params
+    return (json.dumps(message) + "\n").encode()
+
+
+async def _round_trip(entry):
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, *entry,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env,
+    )
+    responses = {}
+
+    async def read_until(ids):
+        while not ids <= responses.keys():
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout=30)
+            assert line, "server closed stdout early"
+            message = json.loads(line)
+            if "id" in message:
+                responses[message["id"]] = message
+
+    try:
+        proc.stdin.write(_message(1, "initialize", {
+            "protocolVersion": "2025-03-26",
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "0"},
+        }))
+        await proc.stdin.drain()
+        await read_until({1})
+        proc.stdin.write(_message(None, "notifications/initialized"))
+
+        # Pipeline several requests so their handler tasks overlap
+        project = {"project_path": str(TEST_REPORT)}
+        proc.stdin.write(_message(2, "tools/list"))
+        proc.stdin.write(_message(3, "tools/call", {"name": "list_tables", "arguments": project}))
+        proc.stdin.write(_message(4, "tools/call", {"name": "list_measures", "arguments": project}))
+        proc.stdin.write(_message(5, "tools/call", {"name": "no_such_tool", "arguments": {}}))
+        proc.stdin.write(_message(6, "resources/list"))
+        await proc.stdin.drain()
+        await read_until({2, 3, 4, 5, 6})
+    finally:
+        proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    return responses
+
+
+def _check(responses):
+    assert responses[1]["result"]["serverInfo"]["name"] == "pbip-mcp-server"
+    assert "list_tables" in {tool["name"] for tool in responses[2]["result"]["tools"]}
+    assert json.loads(responses[3]["result"]["content"][0]["text"])["count"] == 5
+    assert "measures" in json.loads(responses[4]["result"]["content"][0]["text"])
+    assert "Unknown tool" in responses[5]["result"]["content"][0]["text"]
+    assert len(responses[6]["result"]["resources"]) == 2
+
+
+async def test_stdio_round_trip_asyncio():
+    _check(await _round_trip(ASYNCIO_ENTRY))
+
+
+@pytest.mark.skipif(importlib.util.find_spec("uvloop") is None, reason="uvloop not installed")
+async def test_stdio_round_trip_uvloop():
+    _check(await _round_trip(UVLOOP_ENTRY))